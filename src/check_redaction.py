@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Redaction Check
+
+Fast, deterministic check of FrameRedactor from main.py: privacy masks must
+cover exactly their pixels of the grabbed frame, including on HiDPI displays
+where the frame has more pixels than the selected area has points.
+"""
+
+import os
+import sys
+
+import mss.screenshot
+from PIL import Image
+
+from main import REDACTION_MODES, FrameRedactor
+
+AREA = {"left": 0, "top": 0, "width": 100, "height": 100}
+MASK = {"left": 50, "top": 50, "width": 50, "height": 50}
+SCALES = (1, 1.5, 2)
+
+
+def check_redaction(mode, scale):
+    """Redact one fake frame and return a list of failure messages."""
+    size = (int(AREA["width"] * scale), int(AREA["height"] * scale))
+    frame = mss.screenshot.ScreenShot.from_size(
+        bytearray(os.urandom(size[0] * size[1] * 4)), *size
+    )
+    original = Image.frombytes("RGB", size, frame.rgb)
+
+    redactor = FrameRedactor([MASK], mode=mode)
+    redactor.set_area(AREA)
+    rgb, redacted_size = redactor.apply(frame)
+    if redacted_size != size:
+        return [f"{mode} at {scale}x: frame size changed to {redacted_size}"]
+    image = Image.frombytes("RGB", size, rgb)
+
+    # The mask covers the bottom-right quarter of the area
+    edge = (int(MASK["left"] * scale), int(MASK["top"] * scale))
+    masked = (edge[0], edge[1], size[0], size[1])
+    unmasked = [(0, 0, size[0], edge[1]), (0, edge[1], edge[0], size[1])]
+
+    failures = []
+    if image.crop(masked).tobytes() == original.crop(masked).tobytes():
+        failures.append(f"{mode} at {scale}x: masked pixels left unredacted")
+    if mode == "blackout" and any(
+        high != 0 for _, high in image.crop(masked).getextrema()
+    ):
+        failures.append(f"{mode} at {scale}x: part of the mask is not black")
+    for box in unmasked:
+        if image.crop(box).tobytes() != original.crop(box).tobytes():
+            failures.append(f"{mode} at {scale}x: pixels outside the mask changed")
+            break
+    return failures
+
+
+if __name__ == "__main__":
+    failures = []
+    for mode in REDACTION_MODES:
+        for scale in SCALES:
+            failures.extend(check_redaction(mode, scale))
+
+    if failures:
+        print("Redaction check FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print(
+        f"Redaction check passed ({len(REDACTION_MODES)} modes at "
+        + ", ".join(f"{scale}x" for scale in SCALES)
+        + ")"
+    )
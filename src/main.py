@@ -5,11 +5,15 @@ Area Screenshot Tool
 This GUI application provides visual area selection for taking periodic screenshots.
 Features include:
 - Visual area selection with mouse drag
-- Multiple monitor support
+- Multiple monitor support, including one overlay spanning all monitors
+- Snapping the selection to window and monitor edges
 - Configurable screenshot interval
 - Maximum screenshot count limit
 - Automatic cleanup of old screenshots
 - Latest.png file for most recent screenshot
+- Live preview of the capture area
+- Privacy masks (blackout, pixelate or blur) applied before frames are saved
+- Session export to a deduplicated zip or tar bundle
 - Error handling with consecutive error tracking
 - Command line argument support
 
@@ -18,35 +22,672 @@ from the command-line main.py tool.
 """
 
 import argparse
+import bisect
+import hashlib
+import io
+import json
+import math
 import os
+import shutil
 import sys
+import tarfile
 import threading
 import time
 import tkinter as tk
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from tkinter import messagebox, ttk
 
 import mss
+import mss.screenshot
 import mss.tools
-from PIL import Image, ImageTk
+from PIL import Image, ImageChops, ImageFilter, ImageTk
+
+REDACTION_MODES = ("blackout", "pixelate", "blur")
+
+# The worker thread never touches Tk; the UI polls its state on this tick
+UI_TICK_MS = 200
+PREVIEW_SIZE = (320, 180)
+PREVIEW_MIN_INTERVAL = 0.5  # seconds between preview refreshes
+
+# Selection overlay: redraws are coalesced to roughly one per display frame
+OVERLAY_FRAME_MS = 16
+SNAP_DISTANCE = 8  # pixels
+CLICK_SLOP = 3  # pixels a click may move and still select the window under it
+
+# DwmGetWindowAttribute attributes used for window snapping on Windows
+DWMWA_EXTENDED_FRAME_BOUNDS = 9
+DWMWA_CLOAKED = 14
+
+
+def list_window_rects():
+    """Visible top-level window rectangles in screen coordinates, topmost first.
+
+    Uses Quartz on macOS (optional, from the ``snap`` extra) and the
+    Win32 and DWM APIs on Windows. Elsewhere there is nothing to snap to but
+    monitors.
+    """
+    rects = []
+    if sys.platform == "darwin":
+        try:
+            import Quartz
+        except ImportError:
+            return rects
+        windows = Quartz.CGWindowListCopyWindowInfo(
+            Quartz.kCGWindowListOptionOnScreenOnly
+            | Quartz.kCGWindowListExcludeDesktopElements,
+            Quartz.kCGNullWindowID,
+        )
+        for window in windows or []:
+            if window.get("kCGWindowLayer", 0) != 0:
+                continue  # Menu bar, dock and other system layers
+            bounds = window["kCGWindowBounds"]
+            rects.append(
+                {
+                    "left": int(bounds["X"]),
+                    "top": int(bounds["Y"]),
+                    "width": int(bounds["Width"]),
+                    "height": int(bounds["Height"]),
+                }
+            )
+    elif sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        dwmapi = ctypes.windll.dwmapi
+
+        def dwm_attribute(hwnd, attribute, value):
+            return (
+                dwmapi.DwmGetWindowAttribute(
+                    hwnd, attribute, ctypes.byref(value), ctypes.sizeof(value)
+                )
+                == 0  # S_OK
+            )
+
+        def add_window(hwnd, _):
+            if not user32.IsWindowVisible(hwnd) or user32.IsIconic(hwnd):
+                return True
+
+            # Cloaked windows (other virtual desktops, suspended UWP apps)
+            # report as visible but aren't on screen
+            cloaked = wintypes.DWORD()
+            if dwm_attribute(hwnd, DWMWA_CLOAKED, cloaked) and cloaked.value:
+                return True
+
+            # GetWindowRect includes the invisible resize borders Windows 10
+            # adds; the extended frame bounds are what is actually drawn
+            rect = wintypes.RECT()
+            if not dwm_attribute(hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, rect):
+                if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+                    return True
+            if rect.right > rect.left and rect.bottom > rect.top:
+                rects.append(
+                    {
+                        "left": rect.left,
+                        "top": rect.top,
+                        "width": rect.right - rect.left,
+                        "height": rect.bottom - rect.top,
+                    }
+                )
+            return True
+
+        enum_proc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        user32.EnumWindows(enum_proc(add_window), 0)
+    return rects
+
+
+def snap_edge(value, edges):
+    """Return the edge nearest to value within SNAP_DISTANCE, else value."""
+    index = bisect.bisect_left(edges, value)
+    nearest = min(
+        edges[max(index - 1, 0) : index + 1],
+        key=lambda edge: abs(edge - value),
+        default=None,
+    )
+    if nearest is not None and abs(nearest - value) <= SNAP_DISTANCE:
+        return nearest
+    return value
+
+
+class FrameRedactor:
+    """Redact privacy masks out of raw captured frames.
+
+    Masks are absolute screen rectangles (same shape as ``selected_area``).
+    They are clipped to the capture area once in ``set_area`` so the per-frame
+    work is a single BGRA decode plus one Pillow operation per masked box.
+    Masks and area are in screen points; on HiDPI displays the grabbed frame
+    has more pixels than the area, so the boxes are scaled to the frame size
+    (once per distinct size).
+    """
+
+    def __init__(self, masks=None, mode="blackout", pixel_size=16, blur_radius=12):
+        if mode not in REDACTION_MODES:
+            raise ValueError(f"Unknown redaction mode: {mode}")
+        self.masks = list(masks or [])
+        self.mode = mode
+        self.pixel_size = pixel_size
+        self.blur_radius = blur_radius
+        self.boxes = []
+        self.area_size = None
+        self.scaled_size = None
+        self.scaled_boxes = []
+
+    def set_area(self, area):
+        """Translate the masks into (x1, y1, x2, y2) boxes relative to area."""
+        boxes = []
+        for mask in self.masks:
+            x1 = max(mask["left"], area["left"]) - area["left"]
+            y1 = max(mask["top"], area["top"]) - area["top"]
+            x2 = min(mask["left"] + mask["width"], area["left"] + area["width"])
+            y2 = min(mask["top"] + mask["height"], area["top"] + area["height"])
+            x2 -= area["left"]
+            y2 -= area["top"]
+            if x2 > x1 and y2 > y1:
+                boxes.append((x1, y1, x2, y2))
+        self.boxes = boxes
+        self.area_size = (area["width"], area["height"])
+        self.scaled_size = None
+
+    def boxes_for(self, size):
+        """Return the mask boxes in pixels of a frame of the given size."""
+        if size != self.scaled_size:
+            scale_x = size[0] / self.area_size[0]
+            scale_y = size[1] / self.area_size[1]
+            # Round outwards so a fractional scale never leaves an edge exposed
+            self.scaled_boxes = [
+                (
+                    math.floor(x1 * scale_x),
+                    math.floor(y1 * scale_y),
+                    min(math.ceil(x2 * scale_x), size[0]),
+                    min(math.ceil(y2 * scale_y), size[1]),
+                )
+                for x1, y1, x2, y2 in self.boxes
+            ]
+            self.scaled_size = size
+        return self.scaled_boxes
+
+    def apply(self, screenshot):
+        """Return (rgb_bytes, size) for the frame with every mask redacted."""
+        if not self.boxes:
+            return screenshot.rgb, screenshot.size
+
+        # Decode BGRA straight into RGB in C instead of going through .rgb
+        image = Image.frombuffer(
+            "RGB", screenshot.size, screenshot.bgra, "raw", "BGRX", 0, 1
+        )
+        for box in self.boxes_for(image.size):
+            if self.mode == "blackout":
+                image.paste((0, 0, 0), box)
+                continue
+
+            region = image.crop(box)
+            if self.mode == "pixelate":
+                width, height = region.size
+                small = region.resize(
+                    (
+                        max(1, width // self.pixel_size),
+                        max(1, height // self.pixel_size),
+                    ),
+                    Image.Resampling.BOX,
+                )
+                region = small.resize((width, height), Image.Resampling.NEAREST)
+            else:
+                region = region.filter(ImageFilter.GaussianBlur(self.blur_radius))
+            image.paste(region, box)
+
+        return image.tobytes(), image.size
+
+
+class ScreenshotRetention:
+    """Oldest-first record of saved screenshots, pruned to ``keep`` on disk."""
+
+    def __init__(self, screenshots_dir, keep, log=print):
+        self.screenshots_dir = screenshots_dir
+        self.keep = keep
+        self.log = log
+        self.retained = deque()
+
+    def load(self):
+        """Seed retention with screenshots already on disk, oldest first."""
+        try:
+            screenshot_files = sorted(
+                Path(self.screenshots_dir).glob("screenshot_*.png"),
+                key=lambda x: x.stat().st_mtime,
+            )
+            self.retained = deque(str(path) for path in screenshot_files)
+        except Exception as e:
+            self.log(f"Warning: Error scanning old screenshots: {e}")
+            self.retained = deque()
+        self.cleanup_old_screenshots()
+
+    def add(self, filepath):
+        # Sub-second intervals can reuse a filename; it's already retained
+        if not self.retained or self.retained[-1] != filepath:
+            self.retained.append(filepath)
+        self.cleanup_old_screenshots()
+
+    def cleanup_old_screenshots(self):
+        """Remove old screenshots, keeping only the most recent ``keep``."""
+        while len(self.retained) > self.keep:
+            filepath = self.retained.popleft()
+            try:
+                os.unlink(filepath)
+                self.log(f"Removed old screenshot: {os.path.basename(filepath)}")
+            except OSError as e:
+                self.log(
+                    f"Warning: Error removing {os.path.basename(filepath)}: {e}"
+                )
+
+
+class SpoolFlusher:
+    """Move frames from a fast spool directory to persistent storage in batches.
+
+    The capture loop saves into the spool (e.g. ``/dev/shm``) and submits each
+    frame here. Every ``flush_interval`` seconds the pending frames are copied
+    to ``screenshots_dir`` with one fsync pass per group of files and a single
+    directory fsync. Frames that retention would drop anyway are never copied.
+
+    Spool names carry the frame's sequence number, so frames taken within the
+    same second never overwrite each other in the spool; the saved name drops
+    it and the newest of those frames wins, as without a spool.
+    """
+
+    fsync_group = 32  # Files held open at once while waiting on fsync
+
+    def __init__(self, spool_dir, screenshots_dir, keep, flush_interval=5.0, log=print):
+        self.spool_dir = spool_dir
+        self.screenshots_dir = screenshots_dir
+        self.keep = keep
+        self.flush_interval = flush_interval
+        self.log = log
+        self.retention = ScreenshotRetention(screenshots_dir, keep, log=log)
+
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.flushed_count = 0
+        self.skipped_count = 0
+
+    def start(self):
+        self.retention.load()
+
+        # Pick up frames left in the spool by a session that didn't flush
+        leftovers = sorted(
+            Path(self.spool_dir).glob("screenshot_*.png"),
+            key=lambda x: x.stat().st_mtime,
+        )
+        for path in leftovers:
+            self.submit(str(path))
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the background thread after a final flush."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def submit(self, filepath):
+        with self.lock:
+            self.pending.append(filepath)
+
+    def run(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush_safely()
+        self.flush_safely()
+
+    def flush_safely(self):
+        # An unexpected error must not kill the thread and strand the spool
+        try:
+            self.flush()
+        except Exception as e:
+            self.log(f"Warning: Error during spool flush: {e}")
+
+    def flush(self):
+        with self.lock:
+            batch = list(dict.fromkeys(self.pending))
+            self.pending.clear()
+        if not batch:
+            return
+
+        # Frames saved under the same name replace each other; keep the newest
+        newest = {}
+        for filepath in batch:
+            newest[self.destination_for(filepath)] = filepath
+        superseded = [
+            filepath
+            for filepath in batch
+            if newest[self.destination_for(filepath)] != filepath
+        ]
+        batch = list(newest.values())
+
+        # Only the newest `keep` frames could survive retention. This also
+        # bounds the spool when earlier flushes failed and frames piled up.
+        skipped, batch = batch[: -self.keep], batch[-self.keep :]
+        skipped += superseded
+        for filepath in skipped:
+            try:
+                os.unlink(filepath)
+            except OSError:
+                pass
+
+        written = []
+        failed = []
+        for start in range(0, len(batch), self.fsync_group):
+            group_written, group_failed = self.write_group(
+                batch[start : start + self.fsync_group]
+            )
+            written.extend(group_written)
+            failed.extend(group_failed)
+        self.fsync_directory()
+
+        if failed:
+            # Retry on the next flush, ahead of anything captured since
+            with self.lock:
+                self.pending.extendleft(reversed(failed))
+
+        for filepath, destination in written:
+            try:
+                os.unlink(filepath)
+            except OSError:
+                pass
+            self.retention.add(destination)
+
+        if written:
+            self.update_latest(written[-1][1])
+
+        self.flushed_count += len(written)
+        self.skipped_count += len(skipped)
+        if not (written or skipped or failed):
+            return
+        self.log(
+            f"Flushed {len(written)} screenshots to {self.screenshots_dir}"
+            + (
+                f" (skipped {len(skipped)} superseded or beyond keep)"
+                if skipped
+                else ""
+            )
+            + (f" ({len(failed)} failed, will retry)" if failed else "")
+        )
+
+    def write_group(self, filepaths):
+        """Copy a group of frames, then fsync them together.
+
+        Returns (written, failed): (source, destination) pairs that are safely
+        on disk, and source paths that should be retried. A write or fsync
+        error fails the whole group, since any file in it may be incomplete.
+        """
+        opened = []
+        failed = []
+        try:
+            for filepath in filepaths:
+                destination = self.destination_for(filepath)
+                try:
+                    with open(filepath, "rb") as source:
+                        data = source.read()
+                except FileNotFoundError:
+                    continue  # Nothing left to flush
+                except OSError as e:
+                    self.log(
+                        f"Warning: Error flushing {os.path.basename(filepath)}: {e}"
+                    )
+                    failed.append(filepath)
+                    continue
+                try:
+                    output = open(destination, "wb")
+                except OSError as e:
+                    self.log(
+                        f"Warning: Error flushing {os.path.basename(filepath)}: {e}"
+                    )
+                    failed.append(filepath)
+                    continue
+                opened.append((filepath, destination, output))
+                output.write(data)
+
+            for _, _, output in opened:
+                output.flush()
+                os.fsync(output.fileno())
+        except OSError as e:
+            self.log(f"Warning: Error flushing {len(opened)} screenshots: {e}")
+            for filepath, destination, output in opened:
+                try:
+                    output.close()
+                except OSError:
+                    pass
+                try:
+                    os.unlink(destination)  # Don't leave partial copies behind
+                except OSError:
+                    pass
+                failed.append(filepath)
+            failed.sort(key=filepaths.index)
+            return [], failed
+        finally:
+            for _, _, output in opened:
+                try:
+                    output.close()
+                except OSError:
+                    pass
+        return [(filepath, destination) for filepath, destination, _ in opened], failed
+
+    def destination_for(self, filepath):
+        """Saved path for a spooled frame, without its sequence number."""
+        name = os.path.basename(filepath).split(".")[0] + ".png"
+        return os.path.join(self.screenshots_dir, name)
+
+    def fsync_directory(self):
+        try:
+            fd = os.open(self.screenshots_dir, os.O_RDONLY)
+        except OSError:
+            return  # Directories can't be opened for fsync on every platform
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def update_latest(self, destination):
+        latest_filepath = os.path.join(self.screenshots_dir, "latest.png")
+        temp_filepath = latest_filepath + ".tmp"
+        try:
+            shutil.copyfile(destination, temp_filepath)
+            os.replace(temp_filepath, latest_filepath)
+        except OSError as e:
+            self.log(f"Warning: Error updating latest.png: {e}")
+
+
+class CaptureEngine:
+    """The screenshot loop without any Tk: grab, redact, save and retain frames.
+
+    The worker thread only updates attributes on this object; the UI (or the
+    soak test) polls them. ``grab``, ``clock``, ``wall_clock`` and ``sleep``
+    default to the real screen and time and are only replaced by the soak test.
+
+    With a ``flusher`` the frames are saved into its spool directory and handed
+    over to it, and it owns retention in the persistent directory instead.
+    """
+
+    def __init__(
+        self,
+        area,
+        screenshots_dir,
+        interval,
+        max_count=None,
+        keep=100,
+        redactor=None,
+        flusher=None,
+        grab=None,
+        clock=time.monotonic,
+        wall_clock=time.time,
+        sleep=time.sleep,
+        log=print,
+    ):
+        self.area = area
+        self.flusher = flusher
+        self.screenshots_dir = flusher.spool_dir if flusher else screenshots_dir
+        self.interval = interval
+        self.max_count = max_count
+        self.keep = keep
+        self.redactor = redactor or FrameRedactor()
+        self.redactor.set_area(area)
+        self.grab = grab
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self.log = log
+
+        self.stop_poll = 0.1  # How often waits check stop_requested
+        self.stop_requested = False
+        self.pending_stop_reason = None
+        self.screenshot_count = 0
+        self.consecutive_errors = 0
+        self.max_consecutive_errors = 5
+        self.preview_image = None
+        self.last_preview_time = None
+        self.schedule_lag = 0.0
+        self.max_schedule_lag = 0.0
+        self.missed_frames = 0
+        self.retention = ScreenshotRetention(self.screenshots_dir, keep, log=log)
+
+    def run(self):
+        try:
+            if self.flusher:
+                self.flusher.start()
+            if self.grab is not None:
+                self.loop(self.grab)
+            else:
+                with mss.mss() as sct:
+                    self.loop(sct.grab)
+        except Exception as e:
+            # Without a stop reason the UI would show a capture that's running
+            self.log(f"Error in capture thread: {e}")
+            self.pending_stop_reason = f"Capture failed: {e}."
+        finally:
+            if self.flusher:
+                self.flusher.stop()
+
+    def loop(self, grab):
+        if not self.flusher:
+            self.retention.load()
+        next_frame = self.clock()
+
+        while not self.stop_requested:
+            # Check if we've reached the maximum count
+            if self.max_count and self.screenshot_count >= self.max_count:
+                self.pending_stop_reason = "Maximum screenshots reached"
+                break
+
+            self.schedule_lag = self.clock() - next_frame
+            self.max_schedule_lag = max(self.max_schedule_lag, self.schedule_lag)
+
+            try:
+                self.capture_frame(grab)
+            except Exception as e:
+                self.consecutive_errors += 1
+                self.log(f"Error taking screenshot: {str(e)}")
+
+                if self.consecutive_errors >= self.max_consecutive_errors:
+                    self.pending_stop_reason = f"Too many consecutive errors ({self.consecutive_errors}). Stopping."
+                    break
+
+            # Schedule against fixed deadlines so per-frame work doesn't
+            # accumulate as drift; whole intervals that were overrun are skipped
+            next_frame += self.interval
+            behind = self.clock() - next_frame
+            if behind >= self.interval:
+                skipped = int(behind // self.interval)
+                self.missed_frames += skipped
+                next_frame += skipped * self.interval
+
+            self.wait_until(next_frame)
+
+    def wait_until(self, deadline):
+        """Sleep until deadline, checking the stop flag regularly."""
+        while not self.stop_requested:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return
+            self.sleep(min(remaining, self.stop_poll))
+
+    def capture_frame(self, grab):
+        # Take screenshot of selected area
+        screenshot = grab(self.area)
+
+        # Redact before anything is written to disk
+        rgb, size = self.redactor.apply(screenshot)
+
+        # Generate filename with timestamp (same format as main.py)
+        timestamp = datetime.fromtimestamp(self.wall_clock()).strftime(
+            "%Y%m%d_%H%M%S"
+        )
+        if self.flusher:
+            # The flusher may still be reading an earlier frame of this second
+            filename = f"screenshot_{timestamp}.{self.screenshot_count + 1}.png"
+        else:
+            filename = f"screenshot_{timestamp}.png"
+        filepath = os.path.join(self.screenshots_dir, filename)
+        latest_filepath = os.path.join(self.screenshots_dir, "latest.png")
+
+        # Save screenshot to both timestamp file and latest.png
+        self.save_png(rgb, size, filepath)
+        self.save_png(rgb, size, latest_filepath)
+
+        # Downscale here so the Tk thread only has to blit it
+        now = self.clock()
+        if (
+            self.last_preview_time is None
+            or now - self.last_preview_time >= PREVIEW_MIN_INTERVAL
+        ):
+            self.last_preview_time = now
+            preview = Image.frombytes("RGB", size, rgb)
+            preview.thumbnail(PREVIEW_SIZE, Image.Resampling.BILINEAR)
+            self.preview_image = preview
+
+        self.screenshot_count += 1
+        self.consecutive_errors = 0
+
+        self.log(f"Screenshot {self.screenshot_count} saved: {filename}")
+
+        if self.flusher:
+            self.flusher.submit(filepath)
+        else:
+            self.retention.add(filepath)
+
+    def save_png(self, rgb, size, filepath):
+        # Write under a temporary name so a partial PNG is never visible
+        temp_filepath = filepath + ".tmp"
+        mss.tools.to_png(rgb, size, output=temp_filepath)
+        os.replace(temp_filepath, filepath)
 
 
 class ScreenshotTool:
     def __init__(self, args=None):
         self.root = tk.Tk()
         self.root.title("Select area for screenshots for support-copilot")
-        self.root.geometry("500x400")
+        self.root.geometry("500x720")
 
         # Store command line arguments
         self.args = args or self.get_default_args()
 
         self.screenshot_thread = None
-        self.stop_screenshots = False
+        self.engine = None
+        self.stopping = False
         self.selected_area = None
         self.monitor_info = None
-        self.consecutive_errors = 0
-        self.max_consecutive_errors = 5
+        self.masks = list(self.args.masks)
+        self.selection_purpose = "area"
+
+        # Preview currently shown by the UI tick
+        self.shown_preview = None
+        self.preview_photo = None
 
         # Get monitor information
         with mss.mss() as sct:
@@ -62,6 +703,11 @@ class ScreenshotTool:
                 self.max_count = None
                 self.interval = 5.0
                 self.keep = 100
+                self.masks = []
+                self.redact_mode = "blackout"
+                self.output_dir = default_screenshots_dir()
+                self.spool_dir = None
+                self.flush_interval = 5.0
 
         return DefaultArgs()
 
@@ -113,6 +759,21 @@ class ScreenshotTool:
         )
         keep_spinbox.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 5))
 
+        # Redaction mode setting
+        ttk.Label(config_frame, text="Mask redaction:").grid(
+            row=3, column=0, sticky=tk.W, pady=(0, 5)
+        )
+        self.redact_mode_var = tk.StringVar(value=self.args.redact_mode)
+        redact_combo = ttk.Combobox(
+            config_frame,
+            textvariable=self.redact_mode_var,
+            values=REDACTION_MODES,
+            state="readonly",
+            width=10,
+        )
+        redact_combo.grid(row=3, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 5))
+        redact_combo.bind("<<ComboboxSelected>>", lambda _: self.update_redactor())
+
         # Monitor selection
         monitor_frame = ttk.LabelFrame(
             main_frame, text="Monitor Selection", padding="10"
@@ -126,7 +787,7 @@ class ScreenshotTool:
         )
 
         self.monitor_var = tk.StringVar()
-        monitor_combo = ttk.Combobox(
+        self.monitor_combo = ttk.Combobox(
             monitor_frame, textvariable=self.monitor_var, state="readonly"
         )
 
@@ -138,10 +799,18 @@ class ScreenshotTool:
             monitor_options.append(
                 f"Monitor {i} ({monitor['width']}x{monitor['height']})"
             )
+        # Overlay bounds for each option, in the same order
+        self.monitor_choices = self.monitors[1:]
+        if len(self.monitors) > 2:
+            virtual_screen = self.monitors[0]
+            monitor_options.append(
+                f"All monitors ({virtual_screen['width']}x{virtual_screen['height']})"
+            )
+            self.monitor_choices = self.monitor_choices + [virtual_screen]
 
-        monitor_combo["values"] = monitor_options
-        monitor_combo.set(monitor_options[0])
-        monitor_combo.grid(
+        self.monitor_combo["values"] = monitor_options
+        self.monitor_combo.set(monitor_options[0])
+        self.monitor_combo.grid(
             row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10)
         )
 
@@ -173,6 +842,25 @@ class ScreenshotTool:
         )
         self.start_btn.grid(row=2, column=1, sticky=(tk.W, tk.E))
 
+        # Privacy masks
+        self.mask_label = ttk.Label(area_frame, foreground="gray")
+        self.mask_label.grid(
+            row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 5)
+        )
+        self.update_mask_label()
+
+        add_mask_btn = ttk.Button(
+            area_frame,
+            text="Add Privacy Mask",
+            command=lambda: self.select_area(purpose="mask"),
+        )
+        add_mask_btn.grid(row=4, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+
+        clear_masks_btn = ttk.Button(
+            area_frame, text="Clear Masks", command=self.clear_masks
+        )
+        clear_masks_btn.grid(row=4, column=1, sticky=(tk.W, tk.E))
+
         self.stop_btn = ttk.Button(
             main_frame,
             text="Stop Screenshots",
@@ -201,6 +889,16 @@ class ScreenshotTool:
         self.error_label = ttk.Label(status_frame, text="", foreground="red")
         self.error_label.grid(row=2, column=0, columnspan=2)
 
+        # Live preview
+        preview_frame = ttk.LabelFrame(main_frame, text="Preview", padding="10")
+        preview_frame.grid(
+            row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0)
+        )
+        self.preview_label = ttk.Label(
+            preview_frame, text="No preview yet", foreground="gray", anchor=tk.CENTER
+        )
+        self.preview_label.grid(row=0, column=0)
+
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
@@ -211,28 +909,9 @@ class ScreenshotTool:
         area_frame.columnconfigure(0, weight=1)
         area_frame.columnconfigure(1, weight=1)
         status_frame.columnconfigure(0, weight=1)
+        preview_frame.columnconfigure(0, weight=1)
 
-        self.screenshot_count = 0
-
-    def cleanup_old_screenshots(self, screenshots_dir, max_files):
-        """Remove old screenshots, keeping only the most recent max_files."""
-        try:
-            screenshot_files = list(Path(screenshots_dir).glob("screenshot_*.png"))
-
-            if len(screenshot_files) > max_files:
-                # Sort by modification time (newest first)
-                screenshot_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-                # Remove files beyond the limit
-                files_to_remove = screenshot_files[max_files:]
-                for file_path in files_to_remove:
-                    try:
-                        file_path.unlink()
-                        print(f"Removed old screenshot: {file_path.name}")
-                    except OSError as e:
-                        print(f"Warning: Error removing {file_path.name}: {e}")
-        except Exception as e:
-            print(f"Warning: Error during cleanup: {e}")
+        self.root.after(UI_TICK_MS, self.ui_tick)
 
     def validate_settings(self):
         """Validate user input settings."""
@@ -266,15 +945,49 @@ class ScreenshotTool:
             messagebox.showerror("Error", f"Invalid settings: {e}")
             return False
 
-    def select_area(self):
-        """Create a transparent overlay for area selection"""
-        self.root.withdraw()  # Hide main window
+    def update_mask_label(self):
+        if self.masks:
+            self.mask_label.config(text=f"Privacy masks: {len(self.masks)}")
+        else:
+            self.mask_label.config(text="No privacy masks")
 
-        # Get the selected monitor
-        monitor_index = self.monitor_var.get()
-        # Extract monitor number from selection
-        monitor_num = int(monitor_index.split()[1])
-        monitor = self.monitors[monitor_num]
+    def clear_masks(self):
+        self.masks = []
+        self.update_mask_label()
+        self.update_redactor()
+
+    def update_redactor(self):
+        """Apply the current masks and redaction mode to a running capture."""
+        if not self.capture_running():
+            return
+        redactor = FrameRedactor(self.masks, mode=self.redact_mode_var.get())
+        redactor.set_area(self.engine.area)
+        # A single assignment, so the worker sees either the old or the new
+        # redactor for a frame, never a half-updated one
+        self.engine.redactor = redactor
+        print(f"Privacy masks updated: {len(redactor.boxes)} ({redactor.mode})")
+
+    def select_area(self, purpose="area"):
+        """Open the selection overlay over a frozen frame of the screen"""
+        self.selection_purpose = purpose
+        self.root.withdraw()  # Hide main window
+        self.root.update()  # Let it disappear before the backdrop is grabbed
+
+        # Everything the overlay needs is captured once, up front
+        bounds = self.monitor_choices[max(self.monitor_combo.current(), 0)]
+        self.overlay_bounds = bounds
+        self.window_rects = list_window_rects()
+        self.backdrop_photo = self.capture_backdrop(bounds)
+
+        snap_rects = self.window_rects + self.monitors[1:]
+        self.snap_xs = sorted(
+            {r["left"] - bounds["left"] for r in snap_rects}
+            | {r["left"] + r["width"] - bounds["left"] for r in snap_rects}
+        )
+        self.snap_ys = sorted(
+            {r["top"] - bounds["top"] for r in snap_rects}
+            | {r["top"] + r["height"] - bounds["top"] for r in snap_rects}
+        )
 
         # Create selection window
         self.selection_window = tk.Toplevel(self.root)
@@ -282,11 +995,13 @@ class ScreenshotTool:
         self.selection_window.configure(bg="black")
         self.selection_window.overrideredirect(True)  # Remove window decorations
 
-        # Position window on the selected monitor
-        geometry = f"{monitor['width']}x{monitor['height']}+{monitor['left']}+{monitor['top']}"
+        # Position window over the selected monitor(s)
+        geometry = f"{bounds['width']}x{bounds['height']}+{bounds['left']}+{bounds['top']}"
 
         self.selection_window.geometry(geometry)
-        self.selection_window.attributes("-alpha", 0.3)  # Set alpha after geometry
+        if self.backdrop_photo is None:
+            # No frozen frame; fall back to a translucent live overlay
+            self.selection_window.attributes("-alpha", 0.3)  # Set alpha after geometry
 
         self.selection_window.bind("<Button-1>", self.start_selection)
         self.selection_window.bind("<B1-Motion>", self.update_selection)
@@ -297,58 +1012,123 @@ class ScreenshotTool:
         # Create canvas for drawing rectangle
         self.canvas = tk.Canvas(self.selection_window, highlightthickness=0, bg="black")
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        if self.backdrop_photo is not None:
+            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.backdrop_photo)
 
-        # Update the window to ensure proper sizing before creating text
-        self.selection_window.update_idletasks()
-
-        # Instructions - use actual window width
-        instruction_text = "Click and drag to select area. Press ESC to cancel."
-        canvas_width = self.canvas.winfo_width()
-        if canvas_width <= 1:  # Fallback if width not available yet
-            canvas_width = monitor["width"]
+        # Instructions
+        if purpose == "mask":
+            instruction_text = "Click and drag over sensitive content to mask."
+        else:
+            instruction_text = "Click and drag to select area."
+        if self.window_rects:
+            instruction_text += " Click a window to select all of it."
+        instruction_text += " Hold Shift to disable snapping. Press ESC to cancel."
 
         self.canvas.create_text(
-            canvas_width // 2,
+            bounds["width"] // 2,
             50,
             text=instruction_text,
             fill="white",
             font=("Arial", 14),
         )
 
+        # The rectangle is created once and moved in place while dragging
+        self.rect_id = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="red", width=2, state="hidden"
+        )
         self.start_x = self.start_y = 0
-        self.rect_id = None
+        self.press = self.pointer = (0, 0)
+        self.redraw_job = None
+
+    def capture_backdrop(self, bounds):
+        """Grab the overlay region once and dim it for the overlay background."""
+        try:
+            with mss.mss() as sct:
+                screenshot = sct.grab(bounds)
+        except Exception as e:
+            print(f"Warning: Could not capture selection backdrop: {e}")
+            return None
+
+        image = Image.frombuffer(
+            "RGB", screenshot.size, screenshot.bgra, "raw", "BGRX", 0, 1
+        )
+        # HiDPI displays grab more pixels than the overlay has points
+        if image.size != (bounds["width"], bounds["height"]):
+            image = image.resize(
+                (bounds["width"], bounds["height"]), Image.Resampling.BILINEAR
+            )
+        return ImageTk.PhotoImage(image.point(lambda value: value * 6 // 10))
+
+    def snap_point(self, event):
+        if event.state & 0x0001:  # Shift held
+            return event.x, event.y
+        return snap_edge(event.x, self.snap_xs), snap_edge(event.y, self.snap_ys)
+
+    def window_at(self, x, y):
+        """Topmost window containing the absolute point, clipped to the overlay."""
+        bounds = self.overlay_bounds
+        for rect in self.window_rects:
+            if (
+                rect["left"] <= x < rect["left"] + rect["width"]
+                and rect["top"] <= y < rect["top"] + rect["height"]
+            ):
+                x1 = max(rect["left"], bounds["left"])
+                y1 = max(rect["top"], bounds["top"])
+                x2 = min(rect["left"] + rect["width"], bounds["left"] + bounds["width"])
+                y2 = min(rect["top"] + rect["height"], bounds["top"] + bounds["height"])
+                return x1, y1, x2, y2
+        return None
 
     def start_selection(self, event):
-        self.start_x = event.x
-        self.start_y = event.y
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
+        self.press = (event.x, event.y)
+        self.start_x, self.start_y = self.snap_point(event)
+        self.canvas.itemconfigure(self.rect_id, state="hidden")
 
     def update_selection(self, event):
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
-        self.rect_id = self.canvas.create_rectangle(
-            self.start_x, self.start_y, event.x, event.y, outline="red", width=2
-        )
+        # Only remember the pointer; the redraw happens at most once a frame
+        self.pointer = self.snap_point(event)
+        if self.redraw_job is None:
+            self.redraw_job = self.selection_window.after(
+                OVERLAY_FRAME_MS, self.redraw_selection
+            )
+
+    def redraw_selection(self):
+        self.redraw_job = None
+        self.canvas.coords(self.rect_id, self.start_x, self.start_y, *self.pointer)
+        self.canvas.itemconfigure(self.rect_id, state="normal")
 
     def end_selection(self, event):
         # Calculate absolute coordinates
-        monitor_index = self.monitor_var.get()
-        monitor_num = int(monitor_index.split()[1])
-        monitor = self.monitors[monitor_num]
-        offset_x = monitor["left"]
-        offset_y = monitor["top"]
+        offset_x = self.overlay_bounds["left"]
+        offset_y = self.overlay_bounds["top"]
+        end_x, end_y = self.snap_point(event)
 
         # Store selected area (ensure positive width/height)
-        x1 = min(self.start_x, event.x) + offset_x
-        y1 = min(self.start_y, event.y) + offset_y
-        x2 = max(self.start_x, event.x) + offset_x
-        y2 = max(self.start_y, event.y) + offset_y
+        x1 = min(self.start_x, end_x) + offset_x
+        y1 = min(self.start_y, end_y) + offset_y
+        x2 = max(self.start_x, end_x) + offset_x
+        y2 = max(self.start_y, end_y) + offset_y
+
+        # A click without a drag selects the window under the cursor
+        if (
+            abs(event.x - self.press[0]) <= CLICK_SLOP
+            and abs(event.y - self.press[1]) <= CLICK_SLOP
+        ):
+            window = self.window_at(event.x + offset_x, event.y + offset_y)
+            if window:
+                x1, y1, x2, y2 = window
 
         width = x2 - x1
         height = y2 - y1
 
-        if width > 10 and height > 10:  # Minimum size check
+        if width > 10 and height > 10 and self.selection_purpose == "mask":
+            self.masks.append({"left": x1, "top": y1, "width": width, "height": height})
+            self.update_mask_label()
+            self.update_redactor()
+            self.status_label.config(
+                text=f"Privacy mask added: {width}x{height} at ({x1}, {y1})"
+            )
+        elif width > 10 and height > 10:  # Minimum size check
             self.selected_area = {
                 "left": x1,
                 "top": y1,
@@ -356,7 +1136,8 @@ class ScreenshotTool:
                 "height": height,
             }
             self.area_label.config(text=f"Area: {width}x{height} at ({x1}, {y1})")
-            self.start_btn.config(state="normal")
+            if not self.capture_running():
+                self.start_btn.config(state="normal")
             self.status_label.config(text="Area selected! Ready to start screenshots.")
         else:
             messagebox.showwarning(
@@ -371,16 +1152,32 @@ class ScreenshotTool:
 
     def close_selection_window(self):
         if hasattr(self, "selection_window") and self.selection_window:
+            # A coalesced redraw must not fire against the destroyed canvas
+            if self.redraw_job is not None:
+                self.selection_window.after_cancel(self.redraw_job)
+                self.redraw_job = None
             self.selection_window.destroy()
+            self.selection_window = None
+        self.backdrop_photo = None  # Release the frozen frame
         self.root.deiconify()  # Show main window again
         self.root.lift()  # Bring window to front
         self.root.focus_set()  # Give focus back to main window
 
+    def capture_running(self):
+        """True until the worker thread, including its final spool flush, exits."""
+        return bool(self.screenshot_thread and self.screenshot_thread.is_alive())
+
     def start_screenshots(self):
         if not self.selected_area:
             messagebox.showerror("Error", "Please select an area first.")
             return
 
+        if self.capture_running():
+            messagebox.showerror(
+                "Error", "The previous capture is still finishing. Please wait."
+            )
+            return
+
         # Validate settings
         validation = self.validate_settings()
         if not validation:
@@ -388,22 +1185,36 @@ class ScreenshotTool:
 
         _, interval, max_count, keep = validation
 
-        # Create screenshots directory in the root repository folder
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        repo_root = os.path.dirname(
-            script_dir
-        )  # Go up one level from src2 to repo root
-        self.screenshots_dir = os.path.join(repo_root, "screenshots")
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        self.screenshots_dir = self.args.output_dir
+        spool_dir = self.args.spool_dir
+        try:
+            os.makedirs(self.screenshots_dir, exist_ok=True)
+            if spool_dir:
+                os.makedirs(spool_dir, exist_ok=True)
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot create screenshots folder: {e}")
+            return
 
-        # Store settings for the screenshot loop
-        self.current_interval = interval
-        self.current_max_count = max_count
-        self.current_keep = keep
+        flusher = None
+        if spool_dir:
+            flusher = SpoolFlusher(
+                spool_dir,
+                self.screenshots_dir,
+                keep,
+                flush_interval=self.args.flush_interval,
+            )
+
+        # Masks are resolved against the capture area once, not per frame
+        self.engine = CaptureEngine(
+            self.selected_area,
+            self.screenshots_dir,
+            interval,
+            max_count=max_count,
+            keep=keep,
+            redactor=FrameRedactor(self.masks, mode=self.redact_mode_var.get()),
+            flusher=flusher,
+        )
 
-        self.stop_screenshots = False
-        self.screenshot_count = 0
-        self.consecutive_errors = 0
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
 
@@ -415,8 +1226,15 @@ class ScreenshotTool:
 
         print("Starting screenshot capture...")
         print(f"Screenshots will be saved to: {self.screenshots_dir}")
+        if spool_dir:
+            print(
+                f"Spooling to: {spool_dir} (flushed every {self.args.flush_interval} seconds)"
+            )
         print(f"Screenshots to keep: {keep}")
         print(f"Interval: {interval} seconds")
+        redactor = self.engine.redactor
+        if redactor.boxes:
+            print(f"Privacy masks: {len(redactor.boxes)} ({redactor.mode})")
         if max_count:
             print(f"Maximum screenshots: {max_count}")
         else:
@@ -427,111 +1245,70 @@ class ScreenshotTool:
 
         # Start screenshot thread
         self.screenshot_thread = threading.Thread(
-            target=self.screenshot_loop, daemon=True
+            target=self.engine.run, daemon=True
         )
         self.screenshot_thread.start()
 
-    def screenshot_loop(self):
-        with mss.mss() as sct:
-            while not self.stop_screenshots:
-                # Check if we've reached the maximum count
-                if (
-                    self.current_max_count
-                    and self.screenshot_count >= self.current_max_count
-                ):
-                    self.root.after(
-                        0,
-                        lambda: self.stop_screenshots_func(
-                            reason="Maximum screenshots reached"
-                        ),
-                    )
-                    break
-
-                try:
-                    # Take screenshot of selected area
-                    screenshot = sct.grab(self.selected_area)
-
-                    # Generate filename with timestamp (same format as main.py)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"screenshot_{timestamp}.png"
-                    filepath = os.path.join(self.screenshots_dir, filename)
-                    latest_filepath = os.path.join(self.screenshots_dir, "latest.png")
-
-                    # Save screenshot to both timestamp file and latest.png
-                    mss.tools.to_png(screenshot.rgb, screenshot.size, output=filepath)
-                    mss.tools.to_png(
-                        screenshot.rgb, screenshot.size, output=latest_filepath
-                    )
-
-                    self.screenshot_count += 1
-                    self.consecutive_errors = 0
-
-                    print(f"Screenshot {self.screenshot_count} saved: {filename}")
-
-                    # Clean up old screenshots
-                    self.cleanup_old_screenshots(
-                        self.screenshots_dir, max_files=self.current_keep
-                    )
-
-                    # Update UI in main thread
-                    self.root.after(0, self.update_ui)
-
-                except Exception as e:
-                    self.consecutive_errors += 1
-                    error_msg = f"Error taking screenshot: {str(e)}"
-                    print(error_msg)
-
-                    if self.consecutive_errors >= self.max_consecutive_errors:
-                        self.root.after(
-                            0,
-                            lambda: self.stop_screenshots_func(
-                                reason=f"Too many consecutive errors ({self.consecutive_errors}). Stopping."
-                            ),
-                        )
-                        break
-
-                    # Update error display in main thread
-                    self.root.after(
-                        0,
-                        lambda: self.error_label.config(
-                            text=f"Errors: {self.consecutive_errors}/{self.max_consecutive_errors}"
-                        ),
-                    )
-
-                # Wait for the specified interval, checking stop flag regularly
-                interval_steps = int(
-                    self.current_interval * 10
-                )  # Check every 0.1 seconds
-                for _ in range(interval_steps):
-                    if self.stop_screenshots:
-                        break
-                    time.sleep(0.1)
+    def ui_tick(self):
+        """Apply the worker's latest state to the UI in one batch."""
+        engine = self.engine
+        if engine and engine.pending_stop_reason:
+            reason, engine.pending_stop_reason = engine.pending_stop_reason, None
+            self.stop_screenshots_func(reason=reason)
+        elif self.stopping and not self.capture_running():
+            # Only allow a new capture once the old one has fully flushed
+            self.stopping = False
+            if self.selected_area:
+                self.start_btn.config(state="normal")
+        elif not self.stopping and self.capture_running():
+            self.update_ui()
+        self.update_preview()
+        self.root.after(UI_TICK_MS, self.ui_tick)
+
+    def update_preview(self):
+        image = self.engine.preview_image if self.engine else None
+        if image is None or image is self.shown_preview:
+            return
+        self.shown_preview = image
+
+        # Reuse the PhotoImage while the capture size stays the same
+        if self.preview_photo and (
+            self.preview_photo.width(),
+            self.preview_photo.height(),
+        ) == image.size:
+            self.preview_photo.paste(image)
+        else:
+            self.preview_photo = ImageTk.PhotoImage(image)
+            self.preview_label.config(image=self.preview_photo, text="")
 
     def update_ui(self):
-        self.count_label.config(text=f"Screenshots taken: {self.screenshot_count}")
-        if self.consecutive_errors > 0:
+        engine = self.engine
+        self.count_label.config(text=f"Screenshots taken: {engine.screenshot_count}")
+        if engine.consecutive_errors > 0:
             self.error_label.config(
-                text=f"Errors: {self.consecutive_errors}/{self.max_consecutive_errors}"
+                text=f"Errors: {engine.consecutive_errors}/{engine.max_consecutive_errors}"
             )
         else:
             self.error_label.config(text="")
 
     def stop_screenshots_func(self, reason=None):
-        self.stop_screenshots = True
-        self.start_btn.config(state="normal")
+        self.engine.stop_requested = True
+        screenshot_count = self.engine.screenshot_count
+        self.stopping = True  # ui_tick re-enables Start once the thread exits
         self.stop_btn.config(state="disabled")
         folder_path = getattr(self, "screenshots_dir", "screenshots")
 
         if reason:
-            status_text = f"{reason} {self.screenshot_count} screenshots saved in '{folder_path}' folder."
+            status_text = f"{reason} {screenshot_count} screenshots saved in '{folder_path}' folder."
         else:
-            status_text = f"Stopped. {self.screenshot_count} screenshots saved in '{folder_path}' folder."
+            status_text = f"Stopped. {screenshot_count} screenshots saved in '{folder_path}' folder."
 
         self.status_label.config(text=status_text)
+        self.count_label.config(text=f"Screenshots taken: {screenshot_count}")
         self.error_label.config(text="")
 
         print(
-            f"\nScreenshot capture stopped. Total screenshots taken: {self.screenshot_count}"
+            f"\nScreenshot capture stopped. Total screenshots taken: {screenshot_count}"
         )
 
     def run(self):
@@ -539,12 +1316,305 @@ class ScreenshotTool:
         self.root.mainloop()
 
     def on_closing(self):
-        if self.screenshot_thread and self.screenshot_thread.is_alive():
-            self.stop_screenshots = True
-            self.screenshot_thread.join(timeout=1)
+        if self.capture_running():
+            self.engine.stop_requested = True
+            # Leave time for the final spool flush
+            timeout = 10 if self.engine.flusher else 1
+            self.screenshot_thread.join(timeout=timeout)
         self.root.destroy()
 
 
+def default_screenshots_dir():
+    """The screenshots folder in the repository root."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)  # Go up one level from src
+    return os.path.join(repo_root, "screenshots")
+
+
+def parse_rect(value):
+    """Parse an X,Y,WIDTH,HEIGHT screen rectangle."""
+    try:
+        left, top, width, height = (int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid rectangle '{value}', expected X,Y,WIDTH,HEIGHT"
+        )
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Invalid rectangle '{value}', width and height must be positive"
+        )
+    return {"left": left, "top": top, "width": width, "height": height}
+
+
+def benchmark_redaction(masks, frames=50, width=1920, height=1080):
+    """Print the per-frame cost of each redaction mode on a synthetic frame."""
+    area = {"left": 0, "top": 0, "width": width, "height": height}
+    if not masks:
+        # Default to four masks covering roughly a fifth of the frame
+        masks = [
+            {"left": 40, "top": 40, "width": width // 4, "height": height // 8},
+            {"left": width // 2, "top": 40, "width": width // 3, "height": 60},
+            {"left": 40, "top": height // 2, "width": width // 3, "height": height // 4},
+            {"left": width - 400, "top": height - 200, "width": 360, "height": 160},
+        ]
+
+    data = bytearray(os.urandom(width * height * 4))
+
+    print(f"Redaction benchmark: {width}x{height}, {len(masks)} masks, {frames} frames")
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screenshot = mss.screenshot.ScreenShot.from_size(data, width, height)
+        rgb, size = screenshot.rgb, screenshot.size
+    baseline = (time.perf_counter() - start) / frames * 1000
+    print(f"  {'unmasked':<10} {baseline:8.2f} ms/frame")
+
+    for mode in REDACTION_MODES:
+        redactor = FrameRedactor(masks, mode=mode)
+        redactor.set_area(area)
+        start = time.perf_counter()
+        for _ in range(frames):
+            screenshot = mss.screenshot.ScreenShot.from_size(data, width, height)
+            rgb, size = redactor.apply(screenshot)
+        elapsed = (time.perf_counter() - start) / frames * 1000
+        print(f"  {mode:<10} {elapsed:8.2f} ms/frame")
+
+    start = time.perf_counter()
+    mss.tools.to_png(rgb, size)
+    png = (time.perf_counter() - start) * 1000
+    print(f"  (for reference, PNG encoding one frame takes {png:.2f} ms)")
+
+
+# Pillow save options per export format; None keeps the captured PNG bytes
+EXPORT_FORMATS = {
+    "png": None,
+    "webp": {"format": "WEBP", "lossless": True, "method": 1, "quality": 50},
+    "jpeg": {"format": "JPEG", "quality": 85},
+}
+EXPORT_DEDUPE_MODES = ("exact", "perceptual", "none")
+# A frame is perceptually identical to the frame captured before it when no pixel
+# of any channel differs by more than this many levels. The comparison is at
+# full resolution so a changed glyph can never be averaged away.
+PERCEPTUAL_TOLERANCE = 8
+BUNDLE_SUFFIXES = {
+    ".zip": None,
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+    ".tar.xz": "w:xz",
+}
+
+
+def frame_timestamp(path):
+    """Capture time from the screenshot filename, falling back to mtime."""
+    try:
+        return datetime.strptime(path.stem, "screenshot_%Y%m%d_%H%M%S")
+    except ValueError:
+        return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def decode_frame(data):
+    return Image.open(io.BytesIO(data)).convert("RGB")
+
+
+def prepare_export_frame(data, export_format, previous=None):
+    """Compare and optionally transcode one frame in a worker process.
+
+    previous is the encoded frame captured just before this one, given only
+    for perceptual dedupe. Returns (duplicate, data, suffix); duplicate frames
+    are not transcoded. Only encoded bytes cross the process boundary.
+    """
+    image = None
+    duplicate = False
+    if previous is not None:
+        image = decode_frame(data)
+        duplicate = perceptually_identical(image, decode_frame(previous))
+    options = EXPORT_FORMATS[export_format]
+    if options and not duplicate:
+        image = image or decode_frame(data)
+        output = io.BytesIO()
+        image.save(output, **options)
+        data = output.getvalue()
+    suffix = ".jpg" if export_format == "jpeg" else f".{export_format}"
+    return duplicate, data, suffix
+
+
+def run_inline(function, *args):
+    """Run function now and wrap its result like ProcessPoolExecutor.submit."""
+    future = Future()
+    future.set_result(function(*args))
+    return future
+
+
+def perceptually_identical(pixels, previous):
+    if pixels.size != previous.size:
+        return False
+    extrema = ImageChops.difference(pixels, previous).getextrema()
+    return all(high <= PERCEPTUAL_TOLERANCE for _, high in extrema)
+
+
+class BundleWriter:
+    """Append members to a zip or tar bundle chosen by its file extension."""
+
+    def __init__(self, path):
+        suffix = next(
+            (suffix for suffix in BUNDLE_SUFFIXES if path.lower().endswith(suffix)),
+            None,
+        )
+        if suffix is None:
+            raise ValueError(
+                f"Unsupported bundle type '{path}', use one of: "
+                + ", ".join(BUNDLE_SUFFIXES)
+            )
+        self.zip = self.tar = None
+        if suffix == ".zip":
+            self.zip = zipfile.ZipFile(path, "w")
+        else:
+            self.tar = tarfile.open(path, BUNDLE_SUFFIXES[suffix])
+
+    def add(self, name, data, timestamp, compress=False):
+        if self.zip:
+            # Images are already compressed; deflating them again buys nothing
+            info = zipfile.ZipInfo(name, date_time=timestamp.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            self.zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = timestamp.timestamp()
+            self.tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        (self.zip or self.tar).close()
+
+
+def export_session(args):
+    """Stream the capture folder into a bundle in one pass.
+
+    Frames are read and hashed in order; byte-identical repeats never leave
+    this process. The rest are compared with the frame captured before them
+    and transcoded in worker processes, with a bounded number in flight;
+    perceptually identical frames point at their predecessor's member in the
+    manifest instead of being written. When there is nothing to decode, frames
+    are written straight from this process. manifest.json records every
+    captured timestamp and which bundle member shows it. Frames removed by
+    retention while exporting a live session are skipped.
+    """
+    screenshots_dir = Path(args.output_dir)
+    frames = sorted(screenshots_dir.glob("screenshot_*.png"))
+    if not frames:
+        print(f"Error: No screenshots found in {screenshots_dir}")
+        return False
+
+    dedupe = args.export_dedupe != "none"
+    perceptual = args.export_dedupe == "perceptual"
+    workers = args.export_workers or os.cpu_count() or 1
+    # Without decoding the workers would only pickle the bytes there and back
+    needs_decode = perceptual or EXPORT_FORMATS[args.export_format] is not None
+    bundle = BundleWriter(args.export)
+
+    print(f"Exporting {len(frames)} screenshots from {screenshots_dir} to {args.export}")
+    start = time.perf_counter()
+
+    manifest = []
+    member_for = {}  # digest -> bundle member showing that frame
+    previous_data = None
+    kept = exact_duplicates = perceptual_duplicates = missing = 0
+    bytes_in = bytes_out = 0
+
+    def write(path, timestamp, digest, future):
+        nonlocal kept
+        nonlocal exact_duplicates, perceptual_duplicates, bytes_out
+        entry = {"timestamp": timestamp.isoformat(), "source": path.name}
+
+        if future is None:
+            entry["file"] = member_for[digest]
+            entry["duplicate"] = "exact"
+            exact_duplicates += 1
+        else:
+            duplicate, data, suffix = future.result()
+            if duplicate:
+                # The predecessor is always the previous manifest entry
+                entry["file"] = manifest[-1]["file"]
+                entry["duplicate"] = "perceptual"
+                perceptual_duplicates += 1
+            else:
+                entry["file"] = f"frames/{path.stem}{suffix}"
+                bundle.add(entry["file"], data, timestamp)
+                kept += 1
+                bytes_out += len(data)
+            member_for[digest] = entry["file"]
+        manifest.append(entry)
+
+    pool = None
+    if needs_decode and workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    submit = pool.submit if pool else run_inline
+    try:
+        # Keep a few encoded frames per worker queued so memory stays bounded
+        queued = deque()
+        for path in frames:
+            try:
+                with open(path, "rb") as source:
+                    data = source.read()
+                timestamp = frame_timestamp(path)
+            except FileNotFoundError:
+                print(f"Warning: Skipping {path.name}, removed during export")
+                missing += 1
+                continue
+            bytes_in += len(data)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+
+            if dedupe and digest in member_for:
+                queued.append((path, timestamp, digest, None))
+            else:
+                if dedupe:
+                    member_for[digest] = None  # Resolved once its result is written
+                future = submit(
+                    prepare_export_frame,
+                    data,
+                    args.export_format,
+                    previous_data if perceptual else None,
+                )
+                queued.append((path, timestamp, digest, future))
+            previous_data = data
+
+            while len(queued) >= workers * 4:
+                write(*queued.popleft())
+        while queued:
+            write(*queued.popleft())
+
+        bundle.add(
+            "manifest.json",
+            json.dumps(
+                {
+                    "exported": datetime.now().isoformat(timespec="seconds"),
+                    "source": str(screenshots_dir),
+                    "format": args.export_format,
+                    "dedupe": args.export_dedupe,
+                    "frames": manifest,
+                },
+                indent=2,
+            ).encode(),
+            datetime.now(),
+            compress=True,
+        )
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        bundle.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Exported {kept} of {len(frames)} screenshots in {elapsed:.1f}s "
+        f"({exact_duplicates} exact and {perceptual_duplicates} perceptual duplicates dropped)"
+    )
+    if missing:
+        print(f"Skipped {missing} screenshots removed during export")
+    print(f"Size: {bytes_in / 2**20:.1f} MB captured -> {bytes_out / 2**20:.1f} MB exported")
+    return True
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -557,6 +1627,12 @@ Examples:
   python app.py --interval 10              # GUI with 10 second intervals
   python app.py --keep 5                   # GUI keeping only 5 screenshots
   python app.py --max-count 50 --interval 3 --keep 15  # GUI with custom settings
+  python app.py --mask 0,0,400,80 --redact-mode blur   # Blur a screen region
+  python app.py --benchmark-redaction      # Measure per-frame redaction cost
+  python app.py --output-dir ~/captures    # Save screenshots somewhere else
+  python app.py --spool-dir /dev/shm/support-copilot  # Spool frames in RAM
+  python app.py --export session.zip       # Bundle the session for a colleague
+  python app.py --export session.tar --export-format webp  # Smaller lossless frames
         """,
     )
 
@@ -584,6 +1660,78 @@ Examples:
         help="Number of screenshots to keep (default: 100)",
     )
 
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        default=default_screenshots_dir(),
+        help="Folder screenshots are saved to (default: screenshots/ in the repository root)",
+    )
+
+    parser.add_argument(
+        "--spool-dir",
+        default=None,
+        help="Fast folder (e.g. /dev/shm/support-copilot) to capture into; "
+        "frames are flushed to the output folder in batches (default: off)",
+    )
+
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between spool flushes to the output folder (default: 5)",
+    )
+
+    parser.add_argument(
+        "--mask",
+        "-m",
+        dest="masks",
+        type=parse_rect,
+        action="append",
+        default=[],
+        metavar="X,Y,WIDTH,HEIGHT",
+        help="Screen rectangle to redact from every screenshot (repeatable)",
+    )
+
+    parser.add_argument(
+        "--redact-mode",
+        choices=REDACTION_MODES,
+        default="blackout",
+        help="How privacy masks are redacted (default: blackout)",
+    )
+
+    parser.add_argument(
+        "--benchmark-redaction",
+        action="store_true",
+        help="Measure per-frame redaction cost and exit",
+    )
+
+    export = parser.add_argument_group("session export")
+    export.add_argument(
+        "--export",
+        metavar="BUNDLE",
+        help="Export the screenshots in the output folder to a .zip, .tar, "
+        ".tar.gz or .tar.xz bundle and exit",
+    )
+    export.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default="png",
+        help="Image format in the bundle; webp is lossless (default: png, as captured)",
+    )
+    export.add_argument(
+        "--export-dedupe",
+        choices=EXPORT_DEDUPE_MODES,
+        default="exact",
+        help="Drop only byte-identical frames, or also frames with no pixel "
+        "changed beyond a small noise tolerance (default: exact)",
+    )
+    export.add_argument(
+        "--export-workers",
+        type=int,
+        default=None,
+        help="Worker processes for fingerprinting and transcoding (default: CPU count)",
+    )
+
     return parser.parse_args()
 
 
@@ -604,6 +1752,16 @@ if __name__ == "__main__":
         print("Error: Max count must be positive")
         sys.exit(1)
 
+    if args.flush_interval <= 0:
+        print("Error: Flush interval must be positive")
+        sys.exit(1)
+
+    if args.spool_dir and os.path.abspath(args.spool_dir) == os.path.abspath(
+        args.output_dir
+    ):
+        print("Error: Spool folder must differ from the output folder")
+        sys.exit(1)
+
     # Check if required packages are available
     try:
         import mss
@@ -615,5 +1773,19 @@ if __name__ == "__main__":
         print("Or if using uv: uv add mss pillow")
         sys.exit(1)
 
+    if args.benchmark_redaction:
+        benchmark_redaction(args.masks)
+        sys.exit(0)
+
+    if args.export:
+        if args.export_workers is not None and args.export_workers <= 0:
+            print("Error: Export workers must be positive")
+            sys.exit(1)
+        try:
+            sys.exit(0 if export_session(args) else 1)
+        except (OSError, ValueError) as e:
+            print(f"Error exporting session: {e}")
+            sys.exit(1)
+
     app = ScreenshotTool(args)
     app.run()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Soak Test
+
+Drives the capture engine from main.py headless, with a fake grabber at
+accelerated time, for as many frames as you like. It samples RSS, open file
+descriptors, capture directory size and schedule drift, reports the top
+tracemalloc growth and exits non-zero when growth exceeds the limits.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import mss
+import mss.screenshot
+
+from main import (
+    REDACTION_MODES,
+    CaptureEngine,
+    FrameRedactor,
+    SpoolFlusher,
+    parse_rect,
+)
+
+
+class FakeClock:
+    """Accelerated clock for soak runs.
+
+    Sleeping advances virtual time instead of blocking, while time spent
+    actually working still counts, so schedule drift stays measurable.
+    """
+
+    def __init__(self, start=None):
+        self.offset = (start if start is not None else time.time()) - time.perf_counter()
+
+    def time(self):
+        return self.offset + time.perf_counter()
+
+    def sleep(self, seconds):
+        self.offset += seconds
+
+
+class FakeGrabber:
+    """Stand-in for ``sct.grab`` cycling through pre-generated frames."""
+
+    def __init__(self, width=64, height=48, variants=8, fail_every=0):
+        self.width = width
+        self.height = height
+        self.frames = [
+            bytearray(os.urandom(width * height * 4)) for _ in range(variants)
+        ]
+        self.fail_every = fail_every
+        self.calls = 0
+
+    def __call__(self, area):
+        self.calls += 1
+        if self.fail_every and self.calls % self.fail_every == 0:
+            raise OSError("Simulated grab failure")
+        data = self.frames[self.calls % len(self.frames)]
+        return mss.screenshot.ScreenShot.from_size(data, self.width, self.height)
+
+
+def current_rss():
+    """Resident set size in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def open_fd_count():
+    """Open file descriptors, or None where /dev/fd doesn't exist (Windows)."""
+    try:
+        return len(os.listdir("/dev/fd"))
+    except OSError:
+        return None
+
+
+def directory_size(path):
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                total += entry.stat().st_size
+            except FileNotFoundError:
+                pass  # Removed by retention while we were scanning
+    return total
+
+
+def run_soak(args):
+    """Drive CaptureEngine headless for args.frames frames and check for growth.
+
+    Returns True when RSS, open file descriptors, capture directory size and
+    schedule drift all stay within the configured limits.
+    """
+    frames = args.frames
+    clock = FakeClock()
+    grabber = FakeGrabber(fail_every=997)
+    area = {"left": 0, "top": 0, "width": grabber.width, "height": grabber.height}
+    screenshots_dir = tempfile.mkdtemp(prefix="support-copilot-soak-")
+    flusher = None
+    if args.spool_dir:
+        os.makedirs(args.spool_dir, exist_ok=True)
+        spool_dir = tempfile.mkdtemp(prefix="support-copilot-soak-", dir=args.spool_dir)
+        flusher = SpoolFlusher(
+            spool_dir,
+            screenshots_dir,
+            args.keep,
+            flush_interval=args.flush_interval,
+            log=lambda message: None,
+        )
+
+    engine = CaptureEngine(
+        area,
+        screenshots_dir,
+        args.interval,
+        max_count=frames,
+        keep=args.keep,
+        redactor=FrameRedactor(args.masks, mode=args.redact_mode),
+        flusher=flusher,
+        grab=grabber,
+        clock=clock.time,
+        wall_clock=clock.time,
+        sleep=clock.sleep,
+        log=lambda message: None,
+    )
+    # Poll the stop flag once per interval; nothing else wakes the loop
+    engine.stop_poll = args.interval
+
+    print(f"Soak test: {frames} frames, {args.interval}s virtual interval")
+    print(f"Capture directory: {screenshots_dir}")
+    if flusher:
+        print(f"Spool directory: {flusher.spool_dir}")
+
+    tracemalloc.start()
+    thread = threading.Thread(target=engine.run, daemon=True)
+    started = time.perf_counter()
+    thread.start()
+
+    # Measure growth from the point where retention has filled the directory
+    warmup = min(frames // 10, max(args.keep, 1000))
+    while thread.is_alive() and (
+        engine.screenshot_count < warmup
+        or (flusher and flusher.flushed_count < min(args.keep, warmup))
+    ):
+        time.sleep(0.05)
+    baseline = {
+        "rss": current_rss(),
+        "fds": open_fd_count(),
+        "dir": directory_size(screenshots_dir),
+    }
+    baseline_snapshot = tracemalloc.take_snapshot()
+    fds_available = baseline["fds"] is not None
+
+    print(f"{'frames':>10} {'rss MB':>9} {'fds':>5} {'dir KB':>9} {'lag s':>8} {'missed':>7}")
+    while thread.is_alive():
+        thread.join(timeout=args.sample_every)
+        print(
+            f"{engine.screenshot_count:>10} {current_rss() / 2**20:>9.1f} "
+            f"{open_fd_count() if fds_available else 'n/a':>5} {directory_size(screenshots_dir) / 1024:>9.1f} "
+            f"{engine.schedule_lag:>8.4f} {engine.missed_frames:>7}"
+        )
+
+    elapsed = time.perf_counter() - started
+    final_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    final = {
+        "rss": current_rss(),
+        "fds": open_fd_count(),
+        "dir": directory_size(screenshots_dir),
+    }
+    retained_files = len(list(Path(screenshots_dir).glob("screenshot_*.png")))
+
+    print(
+        f"\n{engine.screenshot_count} frames in {elapsed:.1f}s "
+        f"({engine.screenshot_count / max(elapsed, 1e-9):.0f} frames/s, "
+        f"{engine.screenshot_count * args.interval / 3600:.1f}h of virtual capture)"
+    )
+    print("Top allocation growth since warmup:")
+    for stat in final_snapshot.compare_to(baseline_snapshot, "lineno")[:10]:
+        print(f"  {stat}")
+
+    failures = []
+    rss_growth = (final["rss"] - baseline["rss"]) / 2**20
+    if rss_growth > args.max_rss_mb:
+        failures.append(f"RSS grew {rss_growth:.1f} MB (limit {args.max_rss_mb})")
+    fd_growth = final["fds"] - baseline["fds"] if fds_available else 0
+    if fd_growth > args.max_fds:
+        failures.append(f"Open fds grew by {fd_growth} (limit {args.max_fds})")
+    dir_growth = (final["dir"] - baseline["dir"]) / 2**20
+    if dir_growth > args.max_dir_mb:
+        failures.append(
+            f"Capture directory grew {dir_growth:.2f} MB (limit {args.max_dir_mb})"
+        )
+    if retained_files > args.keep:
+        failures.append(f"{retained_files} screenshots retained (keep {args.keep})")
+    if engine.max_schedule_lag > args.max_drift:
+        failures.append(
+            f"Schedule drift reached {engine.max_schedule_lag:.3f}s "
+            f"(limit {args.max_drift})"
+        )
+    if engine.pending_stop_reason != "Maximum screenshots reached":
+        failures.append(f"Capture stopped early: {engine.pending_stop_reason}")
+
+    if flusher:
+        spooled_files = len(list(Path(flusher.spool_dir).glob("screenshot_*.png")))
+        if spooled_files:
+            failures.append(f"{spooled_files} screenshots left unflushed in the spool")
+        print(
+            f"Spool flushed {flusher.flushed_count} frames, "
+            f"skipped {flusher.skipped_count} superseded or beyond keep"
+        )
+        shutil.rmtree(flusher.spool_dir, ignore_errors=True)
+    shutil.rmtree(screenshots_dir, ignore_errors=True)
+
+    if failures:
+        print("\nSoak test FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return False
+
+    fds_text = f"{fd_growth:+d}" if fds_available else "n/a"
+    print(
+        f"\nSoak test passed (rss {rss_growth:+.1f} MB, fds {fds_text}, "
+        f"dir {dir_growth:+.2f} MB, max drift {engine.max_schedule_lag:.3f}s)"
+    )
+    return True
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Soak Test - Run the capture loop headless and check for growth",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python soak.py 1000000                   # One million frames at 5 second intervals
+  python soak.py 100000 --keep 10          # Retention under a small keep count
+  python soak.py 100000 --spool-dir /dev/shm/support-copilot  # Soak the spool flusher
+        """,
+    )
+
+    parser.add_argument("frames", type=int, help="Number of frames to capture")
+
+    parser.add_argument(
+        "--interval",
+        "-i",
+        type=float,
+        default=5.0,
+        help="Virtual interval between screenshots in seconds (default: 5)",
+    )
+
+    parser.add_argument(
+        "--keep",
+        "-k",
+        type=int,
+        default=100,
+        help="Number of screenshots to keep (default: 100)",
+    )
+
+    parser.add_argument(
+        "--mask",
+        "-m",
+        dest="masks",
+        type=parse_rect,
+        action="append",
+        default=[],
+        metavar="X,Y,WIDTH,HEIGHT",
+        help="Privacy mask applied to every fake frame (repeatable)",
+    )
+
+    parser.add_argument(
+        "--redact-mode",
+        choices=REDACTION_MODES,
+        default="blackout",
+        help="How privacy masks are redacted (default: blackout)",
+    )
+
+    parser.add_argument(
+        "--spool-dir",
+        default=None,
+        help="Capture through a spool folder and SpoolFlusher (default: off)",
+    )
+
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=5.0,
+        help="Real seconds between spool flushes (default: 5)",
+    )
+
+    parser.add_argument(
+        "--sample-every",
+        type=float,
+        default=10.0,
+        metavar="SECONDS",
+        help="Real seconds between samples (default: 10)",
+    )
+
+    parser.add_argument(
+        "--max-rss-mb",
+        type=float,
+        default=20.0,
+        help="Maximum RSS growth after warmup in MB (default: 20)",
+    )
+
+    parser.add_argument(
+        "--max-fds",
+        type=int,
+        default=2,
+        help="Maximum growth in open file descriptors (default: 2)",
+    )
+
+    parser.add_argument(
+        "--max-dir-mb",
+        type=float,
+        default=1.0,
+        help="Maximum capture directory growth after warmup in MB (default: 1)",
+    )
+
+    parser.add_argument(
+        "--max-drift",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Maximum lag behind the capture schedule (default: 0.5)",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    if args.frames <= 0:
+        print("Error: Frame count must be positive")
+        sys.exit(1)
+
+    if args.interval <= 0:
+        print("Error: Interval must be positive")
+        sys.exit(1)
+
+    if args.keep <= 0:
+        print("Error: Keep count must be positive")
+        sys.exit(1)
+
+    if args.flush_interval <= 0:
+        print("Error: Flush interval must be positive")
+        sys.exit(1)
+
+    sys.exit(0 if run_soak(args) else 1)